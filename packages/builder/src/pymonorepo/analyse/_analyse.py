@@ -1,15 +1,29 @@
 """Analyse a project"""
 import ast
+import inspect
+import io
+import os
+import re
+import tokenize
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from dataclasses import dataclass, field
-from functools import reduce
+from functools import cached_property, lru_cache
 from pathlib import Path, PurePosixPath
 
 from packaging.requirements import Requirement
-from packaging.utils import NormalizedName
+from packaging.specifiers import SpecifierSet
+from packaging.utils import NormalizedName, canonicalize_name
+from packaging.version import Version
 
 from ._pep621 import Author, License, Pep621Data, ValidPath
-from ._pyproject import PyMetadata, ToolMetadata, parse_pyproject_toml
+from ._pyproject import (
+    PyMetadata,
+    SdistMetadata,
+    ToolMetadata,
+    parse_pyproject_toml,
+)
 
 
 @dataclass
@@ -30,7 +44,7 @@ class ProjectAnalysis:
         """The kebab case name of the project."""
         return self.project["name"]
 
-    @property
+    @cached_property
     def snake_name(self) -> str:
         """The snake case name of the project."""
         return self.project["name"].replace("-", "_")
@@ -75,31 +89,24 @@ def analyse_project(root: Path, in_workspace: bool = False) -> ProjectAnalysis:
     pkg_config = tool_config.get("package", {})
 
     # find module
+    module_path: t.Optional[Path]
     if "module" in pkg_config:
         module_path = root / pkg_config["module"]
         module_name = module_path.name if module_path.is_dir() else module_path.stem
     else:
         module_name = proj_config["name"].replace("-", "_")
-        module_path = None
-        for mpath in [
-            root / module_name,
-            root / "src" / module_name,
-            root / (module_name + ".py"),
-            root / "src" / (module_name + ".py"),
-        ]:
-            if mpath.exists():
-                module_path = mpath
-                break
+        module_path = find_module(root, module_name)
 
     # find dynamic keys, raise if any unsatisfied
     if "dynamic" in proj_config:
 
+        dynamic = proj_config["dynamic"]
         if "about" in pkg_config:
-            mod_info = read_ast_info(root / pkg_config["about"])
+            mod_info = read_ast_info(root / pkg_config["about"], dynamic)
         elif module_path and module_path.is_dir():
-            mod_info = read_ast_info(module_path / "__init__.py")
+            mod_info = read_ast_info(module_path / "__init__.py", dynamic)
         elif module_path:
-            mod_info = read_ast_info(module_path)
+            mod_info = read_ast_info(module_path, dynamic)
         else:
             mod_info = {}
         missing = set(proj_config["dynamic"]) - set(mod_info)  # type: ignore
@@ -117,31 +124,60 @@ def analyse_project(root: Path, in_workspace: bool = False) -> ProjectAnalysis:
     )
 
 
-def analyse_workspace(root: Path, metadata: PyMetadata) -> WorkspaceAnalysis:
-    """Analyse a workspace folder."""
-    proj_config = metadata["project"]
-    tool_config = metadata["tool"]
-    wspace_config = tool_config["workspace"]
+def find_module(root: Path, module_name: str) -> t.Optional[Path]:
+    """Find a module in the project root, or its `src` folder.
 
-    required_dynamic = {
+    Checks in order: `<name>`, `src/<name>`, `<name>.py` and `src/<name>.py`.
+    Each folder is listed once, rather than checking each candidate path exists.
+    """
+    root_names = _list_dir(root)
+    src_names = _list_dir(root / "src") if "src" in root_names else set()
+    for name in (module_name, module_name + ".py"):
+        if name in root_names:
+            return root / name
+        if name in src_names:
+            return root / "src" / name
+    return None
+
+
+def _list_dir(path: Path) -> t.Set[str]:
+    """Return the names of all entries in a directory (empty if it is not a directory)."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+_WORKSPACE_DYNAMIC = frozenset(
+    (
         "license",
         "requires-python",
         "dependencies",
         "entry-points",
         "scripts",
         "gui-scripts",
-    }
+    )
+)
+"""The dynamic keys a workspace must declare (collated from its packages)."""
+
+
+def analyse_workspace(root: Path, metadata: PyMetadata) -> WorkspaceAnalysis:
+    """Analyse a workspace folder."""
+    proj_config = metadata["project"]
+    tool_config = metadata["tool"]
+    wspace_config = tool_config["workspace"]
+
     proj_dynamic = set(proj_config.get("dynamic", []))
-    if proj_dynamic != required_dynamic:
+    if proj_dynamic != _WORKSPACE_DYNAMIC:
         raise RuntimeError(
-            f"Workspace must have dynamic keys: {required_dynamic}, got {proj_dynamic}"
+            f"Workspace must have dynamic keys: {set(_WORKSPACE_DYNAMIC)}, got {proj_dynamic}"
         )
 
     # read all packages first
     packages: t.Dict[str, PackageAnalysis] = {}
-    for pkg_path in wspace_config.get("packages", []):
-        # TODO check all packages have the same build-backend as the workspace?
-        analysis = analyse_project(pkg_path, in_workspace=True)
+    # TODO check all packages have the same build-backend as the workspace?
+    for pkg_path, analysis in _analyse_packages(wspace_config.get("packages", [])):
         if analysis.name in packages:
             other_path = packages[analysis.name].root
             raise RuntimeError(
@@ -150,122 +186,131 @@ def analyse_workspace(root: Path, metadata: PyMetadata) -> WorkspaceAnalysis:
             )
         packages[analysis.name] = analysis
 
-    # collate licence paths
+    # collate the package data, in a single pass over the packages
     licenses: t.List[License] = []
-    for pkg_path, license in [
-        (pkg.root, li)
-        for pkg in packages.values()
-        for li in pkg.project.get("licenses", [])
-    ]:
-        if "path" not in license:
-            continue
-        license_path = pkg_path / license["path"]
-        licenses.append(
-            {
-                "path": t.cast(
-                    ValidPath,
-                    PurePosixPath(license_path.relative_to(root).as_posix()),
-                )
-            }
-        )
-    if licenses:
-        proj_config["licenses"] = licenses
-
-    # collate python version requirement
-    requires_python = [
-        pkg.project["requires_python"]
-        for pkg in packages.values()
-        if "requires_python" in pkg.project
-    ]
-    if requires_python:
-        proj_config["requires_python"] = reduce(lambda a, b: a & b, requires_python)
-
-    # collate entry points
+    requires_python: t.Optional[SpecifierSet] = None
     entry_points: t.Dict[str, t.Dict[str, str]] = {}
-    groups = {
-        name
-        for pkg in packages.values()
-        for name in pkg.project.get("entry_points", {})
-    }
-    for group in groups:
-        # check for conflicts and report the package that defines the conflicting entry point
-        points: t.Dict[str, t.Tuple[str, Path]] = {}
-        for pkg in packages.values():
-            if group not in pkg.project.get("entry_points", {}):
+    # the package root that defines each entry point, to report conflicts
+    point_roots: t.Dict[str, t.Dict[str, Path]] = {}
+    modules: t.Dict[str, Path] = {}
+    package_graph: t.Dict[str, t.Set[Requirement]] = {}
+    dependencies: t.List[Requirement] = []
+    # package versions are parsed once, on first use (note dynamic versions are strings)
+    pkg_versions: t.Dict[str, Version] = {}
+    sdist_config: t.Optional[SdistMetadata] = None
+    for pkg in packages.values():
+        pkg_project = pkg.project
+        pkg_root = pkg.root
+
+        # licence paths
+        pkg_rel_root: t.Optional[PurePosixPath] = None
+        for license in pkg_project.get("licenses", []):
+            if "path" not in license:
                 continue
-            for point_name, point in pkg.project["entry_points"][group].items():
-                if point_name in points:
-                    other_pkg = points[point_name][1]
+            if pkg_rel_root is None:
+                pkg_rel_root = PurePosixPath(pkg_root.relative_to(root).as_posix())
+            licenses.append({"path": t.cast(ValidPath, pkg_rel_root / license["path"])})
+
+        # python version requirement
+        if "requires_python" in pkg_project:
+            pkg_requires = pkg_project["requires_python"]
+            requires_python = (
+                pkg_requires
+                if requires_python is None
+                else requires_python & pkg_requires
+            )
+
+        # entry points,
+        # checking for conflicts and reporting the package that defines the conflicting entry point
+        for group, pkg_points in pkg_project.get("entry_points", {}).items():
+            group_points = entry_points.setdefault(group, {})
+            group_roots = point_roots.setdefault(group, {})
+            for point_name, point in pkg_points.items():
+                if point_name in group_points:
+                    other_pkg = group_roots[point_name]
                     raise RuntimeError(
                         f"Entry point '{group}.{point_name}' defined in both"
-                        f" '{other_pkg}' and '{pkg.root}'"
+                        f" '{other_pkg}' and '{pkg_root}'"
                     )
-                points[point_name] = (point, pkg.root)
-        if points:
-            entry_points[group] = {name: point for name, (point, _) in points.items()}
-    if entry_points:
-        proj_config["entry_points"] = entry_points
+                group_points[point_name] = point
+                group_roots[point_name] = pkg_root
 
-    # collate modules
-    modules: t.Dict[str, Path] = {}
-    for pkg in packages.values():
-        for module_name, module_path in pkg.modules.items():
-            if module_name in modules:
-                other_path = modules[module_name]
-                raise RuntimeError(
-                    f"Module {module_name!r} defined in both"
-                    f" '{other_path}' and '{module_path}'"
-                )
-            modules[module_name] = module_path
-
-    # collate dependencies
-    package_graph: t.Dict[str, t.Set[Requirement]] = {}
-    dependencies: t.List[Requirement] = []
-    for pkg in packages.values():
-        package_graph[pkg.name] = set()
-        pkg_extras = pkg.project.get("optional_dependencies", {})
-        for dep in pkg.project.get("dependencies", []):
-            if dep.name in packages:
-                if not dep.specifier.contains(packages[dep.name].project["version"]):
+        # modules
+        module_conflicts = modules.keys() & pkg.modules.keys()
+        if module_conflicts:
+            module_name = min(module_conflicts)
+            raise RuntimeError(
+                f"Module {module_name!r} defined in both"
+                f" '{modules[module_name]}' and '{pkg.modules[module_name]}'"
+            )
+        modules.update(pkg.modules)
+
+        # dependencies
+        pkg_graph: t.Set[Requirement] = set()
+        package_graph[pkg.name] = pkg_graph
+        for dep in pkg_project.get("dependencies", []):
+            # package names are normalized, so the dependency name must be too
+            dep_name = canonicalize_name(dep.name)
+            dep_pkg = packages.get(dep_name)
+            if dep_pkg is not None:
+                if dep_name not in pkg_versions:
+                    pkg_versions[dep_name] = Version(str(dep_pkg.project["version"]))
+                # the workspace version is always used, even if it is a pre-release
+                if not dep.specifier.contains(pkg_versions[dep_name], prereleases=True):
                     raise RuntimeError(
                         f"Dependency '{dep.name}' version '{dep.specifier}' does not match "
-                        f"workspace version '{packages[dep.name].project['version']!r}': {pkg.root}"
+                        f"workspace version '{dep_pkg.project['version']!r}': {pkg_root}"
+                    )
+                dep_extras = dep_pkg.project.get("optional_dependencies", {})
+                missing_extras = dep.extras - dep_extras.keys()
+                if missing_extras:
+                    raise RuntimeError(
+                        f"Dependency '{dep.name}' extra(s) "
+                        f"{', '.join(repr(e) for e in sorted(missing_extras))} "
+                        f"not defined: {pkg_root}"
                     )
                 for extra in dep.extras:
-                    if extra not in pkg_extras:
-                        raise RuntimeError(
-                            f"Dependency '{dep.name}' extra '{extra}' not defined: {pkg.root}"
-                        )
-                    for extra_dep in pkg_extras[extra]:
-                        if extra_dep.name in packages:
+                    for extra_dep in dep_extras[extra]:
+                        if canonicalize_name(extra_dep.name) in packages:
                             # TODO allow for package dependencies in extras
                             raise NotImplementedError(
                                 f"Dependency '{dep.name}' extra '{extra}' "
-                                f"contains a package: {pkg.root}"
+                                f"contains a package: {pkg_root}"
                             )
                         else:
                             dependencies.append(extra_dep)
-                package_graph[pkg.name].add(dep)
+                pkg_graph.add(dep)
             else:
                 dependencies.append(dep)
+
+        # sdist include/exclude
+        # TODO deal with sdist.use_git
+        pkg_sdist = pkg.tool.get("sdist", {})
+        if pkg_sdist:
+            pkg_prefix = pkg_root.relative_to(root).as_posix() + "/"
+            for clude_name in ("include", "exclude"):
+                cludes: t.List[str] = pkg_sdist.get(clude_name, [])  # type: ignore
+                if cludes:
+                    if sdist_config is None:
+                        sdist_config = tool_config.setdefault("sdist", {})
+                    sdist_config.setdefault(clude_name, []).extend(  # type: ignore
+                        pkg_prefix + clude for clude in cludes
+                    )
+
+    if licenses:
+        proj_config["licenses"] = licenses
+    if requires_python is not None:
+        proj_config["requires_python"] = requires_python
+    entry_points = {
+        group: group_points
+        for group, group_points in entry_points.items()
+        if group_points
+    }
+    if entry_points:
+        proj_config["entry_points"] = entry_points
     if dependencies:
         proj_config["dependencies"] = reduce_dependencies(dependencies)
 
-    # collate sdist include/exclude
-    # TODO deal with sdist.use_git
-    for pkg in packages.values():
-        for clude_name in ("include", "exclude"):
-            cludes: t.List[str] = pkg.tool.get("sdist", {}).get(clude_name, [])  # type: ignore
-            rel_cludes = [
-                (pkg.root.relative_to(root).as_posix() + "/" + clude)
-                for clude in cludes
-            ]
-            if rel_cludes:
-                clude_config = tool_config.setdefault("sdist", {}).setdefault(  # type: ignore
-                    clude_name, []
-                )
-                clude_config.extend(rel_cludes)
-
     return WorkspaceAnalysis(
         root=root,
         project=proj_config,
@@ -275,6 +320,28 @@ def analyse_workspace(root: Path, metadata: PyMetadata) -> WorkspaceAnalysis:
     )
 
 
+def _analyse_packages(
+    paths: t.Sequence[Path],
+) -> t.Iterator[t.Tuple[Path, PackageAnalysis]]:
+    """Analyse the packages of a workspace.
+
+    Each package is independent and analysis is mostly file I/O,
+    so they are analysed in a pool of worker threads
+    (which, unlike processes, also share the pyproject/module caches).
+    Results are yielded in the same order as the input paths.
+    """
+    if len(paths) < 2:
+        for path in paths:
+            yield path, analyse_project(path, in_workspace=True)
+        return
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        futures = [
+            executor.submit(analyse_project, path, in_workspace=True) for path in paths
+        ]
+        for path, future in zip(paths, futures):
+            yield path, future.result()
+
+
 class AstInfo(t.TypedDict, total=False):
     """The information that can be read from a python file."""
 
@@ -283,31 +350,40 @@ class AstInfo(t.TypedDict, total=False):
     authors: t.List[Author]
 
 
-def read_ast_info(path: Path) -> AstInfo:
-    """Read information from a python file."""
-    if not path.exists():
-        raise FileNotFoundError(path)
+AST_INFO_KEYS = frozenset(AstInfo.__annotations__)
+"""The keys that can be read from a python file."""
+
+
+def read_ast_info(path: Path, keys: t.Optional[t.Iterable[str]] = None) -> AstInfo:
+    """Read information from a python file.
+
+    The result is cached by the resolved path, modification time and size of the file,
+    and a copy is returned, so it is safe for the caller to mutate.
+
+    :param keys: Only read these keys (default all), unknown keys are ignored.
+    """
+    wanted = AST_INFO_KEYS if keys is None else AST_INFO_KEYS.intersection(keys)
+    if not wanted:
+        return {}
+    # note, this raises FileNotFoundError (with the path) if the file does not exist
+    stat = path.stat()
+    return deepcopy(
+        _read_ast_info(path.resolve(), stat.st_mtime_ns, stat.st_size, wanted)
+    )
+
+
+@lru_cache(maxsize=512)
+def _read_ast_info(
+    path: Path, mtime_ns: int, size: int, keys: t.FrozenSet[str]
+) -> AstInfo:
+    """Read information from a python file (cached)."""
     # read as bytes to enable custom encodings
-    with path.open("rb") as f:
-        node = ast.parse(f.read())
-    data: t.Dict[str, t.Any] = {}
-    docstring = ast.get_docstring(node)
-    if docstring:
-        data["description"] = docstring
-    for child in node.body:
-        # Only use if it's a simple string assignment
-        if not (isinstance(child, ast.Assign) and isinstance(child.value, ast.Str)):
-            continue
-        for variable, key in (
-            ("__version__", "version"),
-            ("__author__", "name"),
-            ("__email__", "email"),
-        ):
-            if any(
-                isinstance(target, ast.Name) and target.id == variable
-                for target in child.targets
-            ):
-                data[key] = child.value.s
+    source = path.read_bytes()
+    try:
+        data = _scan_source(source, keys)
+    except (SyntaxError, ValueError):
+        # the source could not be fully scanned, so fallback to a full parse
+        data = _parse_source(source, keys, str(path))
     author = {}
     if "name" in data:
         author["name"] = data.pop("name")
@@ -318,16 +394,168 @@ def read_ast_info(path: Path) -> AstInfo:
     return t.cast(AstInfo, data)
 
 
+_MODULE_VARIABLES = {
+    "__version__": "version",
+    "__author__": "name",
+    "__email__": "email",
+}
+"""Mapping of module variables to the information keys."""
+_KEY_VARIABLES = {
+    "version": ("__version__",),
+    "authors": ("__author__", "__email__"),
+}
+"""Mapping of information keys to the module variables they are read from."""
+
+
+def _wanted_variables(keys: t.AbstractSet[str]) -> t.Dict[str, str]:
+    """Return the module variables to read, for the given information keys."""
+    return {
+        variable: _MODULE_VARIABLES[variable]
+        for key in keys
+        for variable in _KEY_VARIABLES.get(key, ())
+    }
+
+
+_STRING = (
+    r"'''(?:[^'\\]|\\[\s\S]|'(?!''))*'''"
+    r'|"""(?:[^"\\]|\\[\s\S]|"(?!""))*"""'
+    # as for the tokenizer, three quotes always start a triple quoted string,
+    # so `"""x"""` cannot also match as `""` + `"x"` + `""` (and be backtracked)
+    r"|(?!''')'(?:[^'\\\n]|\\[\s\S])*'"
+    r'|(?!""")"(?:[^"\\\n]|\\[\s\S])*"'
+)
+"""Regex for a single or triple quoted string literal (without prefix)."""
+_TEXT = (
+    rf"(?:(?:[rRuU]?(?:{_STRING}))[ \t]*)+"
+    # a comment is always consumed up to its line end, so it cannot be split (and backtracked)
+    rf"|\((?:\s|#[^\n]*\n|[rRuU]?(?:{_STRING}))*\)[ \t]*"
+)
+"""Regex for (implicitly concatenated, optionally parenthesized) text string literals."""
+
+_DOCSTRING_RGX = re.compile(
+    rf"(?:[ \t\f]*(?:#[^\n]*)?\n)*(?P<value>{_TEXT})(?:#[^\n]*)?(?:\n|;|\Z)"
+)
+"""Regex to match a docstring at the start of a module."""
+_VARIABLE_RGX = re.compile(
+    rf"^(?P<targets>(?:[^\W\d]\w*[ \t]*=[ \t]*)+)(?P<value>{_TEXT})(?:#[^\n]*)?$"
+    rf"|{_STRING}|#[^\n]*"
+    r"|(?P<open>[(\[{])|(?P<close>[)\]}])|(?P<unsupported>;|\\\n)",
+    re.MULTILINE,
+)
+"""Regex to match top-level variable assignments to string literals.
+
+String literals and comments are also matched (but not captured),
+so that assignments within them are skipped.
+Brackets are matched, so that assignments within them (e.g. keyword arguments) are skipped,
+and semi-colons/line continuations, which the scan does not support.
+"""
+
+
+def _scan_source(
+    source: bytes, keys: t.AbstractSet[str] = AST_INFO_KEYS
+) -> t.Dict[str, t.Any]:
+    """Read information from python source, by scanning it for specific statements.
+
+    This is a lot faster than building the full AST.
+
+    :param keys: The information keys to read.
+
+    :raises SyntaxError: If the source encoding cannot be determined,
+        or a matched string literal cannot be evaluated.
+    :raises ValueError: If the source cannot be decoded,
+        contains statements that cannot be scanned,
+        or any of the keys are not found (they may be in statements the scan does not match).
+    """
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+    text = source.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+    data: t.Dict[str, t.Any] = {}
+    match = _DOCSTRING_RGX.match(text) if "description" in keys else None
+    if match:
+        docstring = ast.literal_eval(match["value"])
+        if not isinstance(docstring, str):
+            raise SyntaxError("docstring is not a string")
+        docstring = inspect.cleandoc(docstring)
+        if docstring:
+            data["description"] = docstring
+    variables = _wanted_variables(keys)
+    depth = 0
+    for match in _VARIABLE_RGX.finditer(text) if variables else ():
+        if match["open"]:
+            depth += 1
+            continue
+        if match["close"]:
+            depth = max(depth - 1, 0)
+            continue
+        if match["unsupported"]:
+            raise ValueError(f"cannot scan statements containing {match[0]!r}")
+        if match["targets"] is None or depth:
+            continue
+        data_keys = [
+            variables[target.strip()]
+            for target in match["targets"].split("=")
+            if target.strip() in variables
+        ]
+        if not data_keys:
+            continue
+        value = ast.literal_eval(match["value"])
+        if not isinstance(value, str):
+            raise SyntaxError(f"assigned value is not a string: {match['value']}")
+        for data_key in data_keys:
+            data[data_key] = value
+    found = set(data)
+    if "name" in data or "email" in data:
+        found.add("authors")
+    if not keys <= found:
+        raise ValueError(f"keys not found by scanning: {sorted(keys - found)}")
+    return data
+
+
+def _parse_source(
+    source: bytes,
+    keys: t.AbstractSet[str] = AST_INFO_KEYS,
+    filename: str = "<unknown>",
+) -> t.Dict[str, t.Any]:
+    """Read information from python source, by parsing it to an AST.
+
+    :param keys: The information keys to read.
+    """
+    node = t.cast(
+        ast.Module, compile(source, filename, "exec", flags=ast.PyCF_ONLY_AST)
+    )
+    data: t.Dict[str, t.Any] = {}
+    docstring = ast.get_docstring(node) if "description" in keys else None
+    if docstring:
+        data["description"] = docstring
+    variables = _wanted_variables(keys)
+    for child in node.body if variables else ():
+        # Only use if it's a simple string assignment
+        if type(child) is not ast.Assign:
+            continue
+        value = child.value
+        if type(value) is not ast.Constant or not isinstance(value.value, str):
+            continue
+        for target in child.targets:
+            if type(target) is ast.Name and target.id in variables:
+                data[variables[target.id]] = value.value
+    return data
+
+
 def reduce_dependencies(deps: t.List[Requirement]) -> t.List[Requirement]:
     """Reduce a list of dependencies, compacting duplicates and merging extras/specifiers."""
-    new_deps: t.Dict[t.Hashable, Requirement] = {}
+    if len(deps) < 2:
+        return list(deps)
+    new_deps: t.Dict[t.Tuple[str, t.Optional[str], t.Optional[str]], Requirement] = {}
     for dep in deps:
-        unique = (dep.name, dep.url, dep.marker)
-        if unique not in new_deps:
-            new_deps[unique] = dep
-        else:
-            new_deps[unique].specifier &= dep.specifier
-            new_deps[unique].extras |= dep.extras
+        # the marker is keyed by its string, since Marker hashing/equality re-serializes it
+        unique = (
+            canonicalize_name(dep.name),
+            dep.url,
+            None if dep.marker is None else str(dep.marker),
+        )
+        existing = new_deps.setdefault(unique, dep)
+        if existing is not dep:
+            existing.specifier &= dep.specifier
+            existing.extras |= dep.extras
 
     # TODO simplify and validate specifiers
     # e.g. if '>1,>2' then '>2'
@@ -3,6 +3,9 @@
 See https://www.python.org/dev/peps/pep-0621/, and
 https://packaging.python.org/en/latest/specifications/declaring-project-metadata
 """
+import codecs
+import os
+import stat
 import typing as t
 from pathlib import Path, PurePosixPath
 
@@ -15,28 +18,36 @@ from packaging.version import parse as parse_version
 __all__ = ("parse", "Pep621Data")
 
 
-_ALLOWED_FIELDS = {
-    "name",
-    "version",
-    "description",
-    "readme",
-    "requires-python",
-    "license",
-    "authors",
-    "maintainers",
-    "keywords",
-    "classifiers",
-    "urls",
-    "entry-points",
-    "scripts",
-    "gui-scripts",
-    "dependencies",
-    "optional-dependencies",
-    "dynamic",
-}
+_ALLOWED_FIELDS = frozenset(
+    {
+        "name",
+        "version",
+        "description",
+        "readme",
+        "requires-python",
+        "license",
+        "authors",
+        "maintainers",
+        "keywords",
+        "classifiers",
+        "urls",
+        "entry-points",
+        "scripts",
+        "gui-scripts",
+        "dependencies",
+        "optional-dependencies",
+        "dynamic",
+    }
+)
 
 _ALLOWED_DYNAMIC_FIELDS = _ALLOWED_FIELDS - {"name", "dynamic"}
 
+_AUTHOR_KEYS = frozenset({"name", "email"})
+"""The allowed keys of an author/maintainer table."""
+
+_EMPTY_NAME = canonicalize_name("")
+"""The placeholder name, before the name is validated."""
+
 
 DYNAMIC_KEY_TYPE = t.Literal[
     "version",
@@ -136,7 +147,7 @@ def parse(data: t.Dict[str, t.Any], root: Path) -> ParseResult:
     :param data: The data from the pyproject.toml file.
     :param root: The folder containing the pyproject.toml file.
     """
-    output: Pep621Data = {"name": canonicalize_name("")}
+    output: Pep621Data = {"name": _EMPTY_NAME}
     errors: t.List[ProjectValidationError] = []
 
     if "project" not in data:
@@ -149,7 +160,7 @@ def parse(data: t.Dict[str, t.Any], root: Path) -> ParseResult:
         return ParseResult(output, errors)
 
     # check for unknown keys
-    unknown_keys = set(project.keys()) - _ALLOWED_FIELDS
+    unknown_keys = project.keys() - _ALLOWED_FIELDS
     if unknown_keys:
         for key in unknown_keys:
             errors.append(ProjectValidationError(f"project.{key}", "key", "unknown"))
@@ -163,7 +174,13 @@ def parse(data: t.Dict[str, t.Any], root: Path) -> ParseResult:
             )
         else:
             for i, item in enumerate(project["dynamic"]):
-                if item not in _ALLOWED_DYNAMIC_FIELDS:
+                if not isinstance(item, str):
+                    errors.append(
+                        ProjectValidationError(
+                            f"project.dynamic.{i}", "type", "must be a string"
+                        )
+                    )
+                elif item not in _ALLOWED_DYNAMIC_FIELDS:
                     errors.append(
                         ProjectValidationError(
                             f"project.dynamic.{i}",
@@ -178,7 +195,7 @@ def parse(data: t.Dict[str, t.Any], root: Path) -> ParseResult:
                         )
                     )
                 else:
-                    output["dynamic"].append(item)
+                    output["dynamic"].append(item)  # type: ignore[arg-type]
 
     # validate name
     if "name" in project:
@@ -292,16 +309,19 @@ def parse(data: t.Dict[str, t.Any], root: Path) -> ParseResult:
                     )
                 )
             else:
-                unknown_keys = set(item.keys()) - {"name", "email"}
+                unknown_keys = item.keys() - _AUTHOR_KEYS
                 for key in unknown_keys:
                     errors.append(
                         ProjectValidationError(
                             f"project.{authkey}.{i}.{key}", "key", "unknown"
                         )
                     )
-                output[authkey].append(  # type: ignore
-                    {key: str(item[key]) for key in ("name", "email") if key in item}
-                )
+                author: Author = {}
+                if "name" in item:
+                    author["name"] = str(item["name"])
+                if "email" in item:
+                    author["email"] = str(item["email"])
+                output[authkey].append(author)
 
     # validate keywords and classifiers
     for pkey in ("keywords", "classifiers"):
@@ -311,6 +331,9 @@ def parse(data: t.Dict[str, t.Any], root: Path) -> ParseResult:
             errors.append(
                 ProjectValidationError(f"project.{pkey}", "type", "must be an array")
             )
+        elif all(isinstance(item, str) for item in project[pkey]):
+            # fast path for the common case, without per-item error handling
+            output[pkey] = list(project[pkey])
         else:
             output[pkey] = []  # type: ignore
             for i, item in enumerate(project[pkey]):
@@ -330,23 +353,9 @@ def parse(data: t.Dict[str, t.Any], root: Path) -> ParseResult:
                 ProjectValidationError("project.urls", "type", "must be a table")
             )
         else:
-            output["urls"] = {}
-            for key, value in project["urls"].items():
-                if not isinstance(key, str):
-                    errors.append(
-                        ProjectValidationError(
-                            f"project.urls.{key}", "type", "key must be a string"
-                        )
-                    )
-                    continue
-                if not isinstance(value, str):
-                    errors.append(
-                        ProjectValidationError(
-                            f"project.urls.{key}", "type", "value must be a string"
-                        )
-                    )
-                    continue
-                output["urls"][key] = value
+            output["urls"] = _validate_str_items(
+                project["urls"], "project.urls", errors
+            )
 
     # validate requires-python
     if "requires-python" in project:
@@ -482,27 +491,9 @@ def parse(data: t.Dict[str, t.Any], root: Path) -> ParseResult:
                         )
                     )
                     continue
-                output["entry_points"][key] = {}
-                for subkey, subvalue in value.items():
-                    if not isinstance(subkey, str):
-                        errors.append(
-                            ProjectValidationError(
-                                f"project.entry-points.{key}.{subkey}",
-                                "type",
-                                "key must be a string",
-                            )
-                        )
-                        continue
-                    if not isinstance(subvalue, str):
-                        errors.append(
-                            ProjectValidationError(
-                                f"project.entry-points.{key}.{subkey}",
-                                "type",
-                                "value must be a string",
-                            )
-                        )
-                        continue
-                    output["entry_points"][key][subkey] = subvalue
+                output["entry_points"][key] = _validate_str_items(
+                    value, f"project.entry-points.{key}", errors
+                )
 
     # validate scripts and gui-scripts
     for ekey, ename in (("scripts", "console_scripts"), ("gui-scripts", "gui_scripts")):
@@ -513,29 +504,43 @@ def parse(data: t.Dict[str, t.Any], root: Path) -> ParseResult:
                 ProjectValidationError(f"project.{ekey}", "type", "must be a table")
             )
         else:
-            output.setdefault("entry_points", {})[ename] = {}
-            for key, value in project[ekey].items():
-                if not isinstance(key, str):
-                    errors.append(
-                        ProjectValidationError(
-                            f"project.{ekey}.{key}", "type", "key must be a string"
-                        )
-                    )
-                    continue
-                if not isinstance(value, str):
-                    errors.append(
-                        ProjectValidationError(
-                            f"project.{ekey}.{key}",
-                            "type",
-                            "value must be a string",
-                        )
-                    )
-                    continue
-                output["entry_points"][ename][key] = value
+            output.setdefault("entry_points", {})[ename] = _validate_str_items(
+                project[ekey], f"project.{ekey}", errors
+            )
 
     return ParseResult(output, errors)
 
 
+def _validate_str_items(
+    table: t.Dict[t.Any, t.Any], key: str, errors: t.List[ProjectValidationError]
+) -> t.Dict[str, str]:
+    """Validate the items of a table, which must have string keys and values.
+
+    :param table: The table.
+    :param key: The key of the table in the project table.
+    :param errors: The list of validation errors. to append to.
+    :returns: The valid items.
+    """
+    output: t.Dict[str, str] = {}
+    for subkey, subvalue in table.items():
+        if not isinstance(subkey, str):
+            errors.append(
+                ProjectValidationError(
+                    f"{key}.{subkey}", "type", "key must be a string"
+                )
+            )
+            continue
+        if not isinstance(subvalue, str):
+            errors.append(
+                ProjectValidationError(
+                    f"{key}.{subkey}", "type", "value must be a string"
+                )
+            )
+            continue
+        output[subkey] = subvalue
+    return output
+
+
 def _parse_readme(
     readme: t.Union[str, t.Dict[str, str]],
     root: Path,
@@ -653,26 +658,61 @@ def _validate_file_path(
         )
         return None
     full_path = root / rel_path
-    if not full_path.is_file():
+    try:
+        # open without blocking, so that a special file (e.g. a FIFO) is rejected below
+        fd = os.open(
+            full_path,
+            os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NONBLOCK", 0),
+        )
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
         errors.append(
             ProjectValidationError(key, "value", f"file not found: {full_path}")
         )
         return None
-    try:
-        full_path.read_text("utf-8")
-    except Exception as exc:
+    except OSError as exc:
         errors.append(ProjectValidationError(key, "value", f"file not readable: {exc}"))
+        return None
+    with open(fd, "rb") as handle:
+        # the file is opened first, then checked, so that only one lookup is required
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            errors.append(
+                ProjectValidationError(key, "value", f"file not found: {full_path}")
+            )
+            return None
+        try:
+            _check_utf8(handle)
+        except Exception as exc:
+            errors.append(
+                ProjectValidationError(key, "value", f"file not readable: {exc}")
+            )
     return t.cast(ValidPath, rel_path)
 
 
+def _check_utf8(handle: t.BinaryIO, chunk_size: int = 65536) -> None:
+    """Check that a file is utf-8 encoded, without reading it all into memory.
+
+    :param handle: The file, opened in binary mode.
+    :param chunk_size: The number of bytes to decode at a time.
+    :raises UnicodeDecodeError: If the file is not valid utf-8.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in iter(lambda: handle.read(chunk_size), b""):
+        decoder.decode(chunk)
+    decoder.decode(b"", final=True)
+
+
+_README_MIMETYPES = {
+    ".rst": "text/x-rst",
+    ".md": "text/markdown",
+    ".markdown": "text/markdown",
+    ".txt": "text/plain",
+}
+"""Mapping of (lower-case) readme file suffixes to their content type."""
+
+
 def _guess_readme_mimetype(path: ValidPath) -> t.Optional[str]:
     """Guess the mimetype of the readme.
 
     :param path: The path to the file.
     """
-    suffix = path.suffix.lower()
-    if suffix == ".rst":
-        return "text/x-rst"
-    if suffix == ".md":
-        return "text/markdown"
-    return None
+    return _README_MIMETYPES.get(path.suffix.lower())
@@ -1,6 +1,10 @@
 """Read the pyproject.toml file, parse and validate it."""
+import fnmatch
+import os
 import re
 import typing as t
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 
 try:
@@ -17,9 +21,22 @@ TOOL_SECTION = "monorepo"
 def read_pyproject_toml(path: Path) -> t.Dict[str, t.Any]:
     """Read the pyproject.toml file.
 
+    The result is cached by the resolved path, modification time and size of the file,
+    and a copy is returned, so it is safe for the caller to mutate.
+
     :returns: The contents of the pyproject.toml file.
     """
-    return tomllib.loads(path.read_text("utf-8"))  # type: ignore[no-any-return]
+    stat = path.stat()
+    return deepcopy(
+        _read_pyproject_toml(path.resolve(), stat.st_mtime_ns, stat.st_size)
+    )
+
+
+@lru_cache(maxsize=512)
+def _read_pyproject_toml(path: Path, mtime_ns: int, size: int) -> t.Dict[str, t.Any]:
+    """Read the pyproject.toml file (cached)."""
+    with path.open("rb") as handle:
+        return tomllib.load(handle)
 
 
 class PyMetadata(t.TypedDict):
@@ -30,11 +47,16 @@ class PyMetadata(t.TypedDict):
 
 
 def parse_pyproject_toml(root: Path) -> PyMetadata:
-    """Read the pyproject.toml file, parse and validate it."""
+    """Read the pyproject.toml file, parse and validate it.
+
+    Only the file read is cached, since validation also depends on other files
+    (e.g. the readme, license and workspace packages).
+    """
     pyproject_file = root.joinpath("pyproject.toml")
-    if not pyproject_file.exists():
-        raise FileNotFoundError(pyproject_file)
-    metadata = read_pyproject_toml(pyproject_file)
+    try:
+        metadata = read_pyproject_toml(pyproject_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(pyproject_file) from None
     # parse and validate the project configuration
     project_result = parse_project(metadata, root)
     # parse and validate the tool configuration
@@ -95,6 +117,12 @@ class ParseToolResult(t.NamedTuple):
     errors: t.List[ProjectValidationError]
 
 
+_ResolveSection = t.Callable[
+    [t.Dict[str, t.Any], Path], t.Tuple[t.Any, t.List[ProjectValidationError]]
+]
+"""A function to parse a sub-table of the tool configuration."""
+
+
 def resolve_tool_section(metadata: t.Dict[str, t.Any], root: Path) -> ParseToolResult:
     """Parse the tool configuration."""
     result = ParseToolResult({}, [])
@@ -120,41 +148,24 @@ def resolve_tool_section(metadata: t.Dict[str, t.Any], root: Path) -> ParseToolR
             )
         )
 
-    if "workspace" in config:
-        if not isinstance(config["workspace"], dict):
-            result.errors.append(
-                ProjectValidationError(
-                    f"tool.{TOOL_SECTION}.workspace", "type", "must be a table"
-                )
-            )
-        else:
-            wresult = _resolve_tool_workspace_section(config["workspace"], root)
-            result.data["workspace"] = wresult[0]
-            result.errors.extend(wresult[1])
-
-    if "package" in config:
-        if not isinstance(config["package"], dict):
-            result.errors.append(
-                ProjectValidationError(
-                    f"tool.{TOOL_SECTION}.package", "type", "must be a table"
-                )
-            )
-        else:
-            presult = _resolve_tool_package_section(config["package"], root)
-            result.data["package"] = presult[0]
-            result.errors.extend(presult[1])
-
-    if "sdist" in config:
-        if not isinstance(config["sdist"], dict):
+    sections: t.Tuple[t.Tuple[str, _ResolveSection], ...] = (
+        ("workspace", _resolve_tool_workspace_section),
+        ("package", _resolve_tool_package_section),
+        ("sdist", _resolve_tool_sdist_section),
+    )
+    for key, resolve_section in sections:
+        if key not in config:
+            continue
+        if not isinstance(config[key], dict):
             result.errors.append(
                 ProjectValidationError(
-                    f"tool.{TOOL_SECTION}.sdist", "type", "must be a table"
+                    f"tool.{TOOL_SECTION}.{key}", "type", "must be a table"
                 )
             )
-        else:
-            sresult = _resolve_tool_sdist_section(config["sdist"], root)
-            result.data["sdist"] = sresult[0]
-            result.errors.extend(sresult[1])
+            continue
+        section, section_errors = resolve_section(config[key], root)
+        result.data[key] = section  # type: ignore[literal-required]
+        result.errors.extend(section_errors)
 
     return result
 
@@ -193,7 +204,7 @@ def _resolve_tool_workspace_section(
                     )
                 )
                 continue
-            packages = [p for p in root.glob(project) if p.is_dir()]
+            packages = _glob_dirs(root, project)
             if not packages:
                 errors.append(
                     ProjectValidationError(
@@ -208,6 +219,46 @@ def _resolve_tool_workspace_section(
     return result, errors
 
 
+GLOB_CHARS_RGX = re.compile(r"[*?[]")
+"""Characters that make a path segment a glob pattern."""
+
+
+def _glob_dirs(root: Path, pattern: str) -> t.List[Path]:
+    """Find the directories matching a glob pattern, relative to a root.
+
+    Literal segments are joined without listing their parent directory,
+    so only segments with wildcards cost a directory scan.
+    Recursive ('**') patterns fall back to ``Path.glob``.
+
+    :param root: The directory to search from.
+    :param pattern: The relative glob pattern.
+    """
+    parts = Path(pattern).parts
+    if "**" in parts:
+        return [p for p in root.glob(pattern) if p.is_dir()]
+    paths = [root]
+    for part in parts:
+        if not GLOB_CHARS_RGX.search(part):
+            paths = [path / part for path in paths]
+            continue
+        matches: t.List[Path] = []
+        for path in paths:
+            try:
+                with os.scandir(path) as entries:
+                    matches.extend(
+                        path / entry.name
+                        for entry in entries
+                        if fnmatch.fnmatch(entry.name, part) and entry.is_dir()
+                    )
+            except OSError:
+                continue
+        paths = matches
+    if parts and not GLOB_CHARS_RGX.search(parts[-1]):
+        # (a trailing pattern segment only matches directories already)
+        paths = [path for path in paths if path.is_dir()]
+    return paths
+
+
 def _resolve_tool_package_section(
     config: t.Dict[str, t.Any], root: Path
 ) -> t.Tuple[PackageMetadata, t.List[ProjectValidationError]]:
@@ -335,7 +386,8 @@ def _validate_glob(
     if not isinstance(value, str):
         errors.append(ProjectValidationError(key, "type", "must be a string"))
         return None
-    if BAD_GLOB_CHARS_RGX.search(value):
+    # control characters are never printable, so most globs skip the regex search
+    if not value.isprintable() and BAD_GLOB_CHARS_RGX.search(value):
         errors.append(
             ProjectValidationError(
                 key, "value", "glob must not contain control characters"
@@ -90,6 +90,6 @@ class GitFolder:
         outb = self.run_git("ls-files", "--recurse-submodules", "-z")
         return {
             self.cwd / PurePosixPath(os.fsdecode(loc))
-            for loc in outb.strip(b"\0").split(b"\0")
+            for loc in outb.split(b"\0")
             if loc
         }
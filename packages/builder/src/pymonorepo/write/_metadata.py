@@ -14,45 +14,47 @@ def create_metadata(project: Pep621Data, root: Path) -> str:
     :project: The project data.
     """
     # required fields
-    metadata_text = "Metadata-Version: 2.1\n"
-    metadata_text += f"Name: {project['name']}\n"
-    metadata_text += f"Version: {project['version']}\n"
+    parts = [
+        "Metadata-Version: 2.1\n",
+        f"Name: {project['name']}\n",
+        f"Version: {project['version']}\n",
+    ]
 
     # optional fields
     if "description" in project:
-        metadata_text += f"Summary: {project['description']}\n"
+        parts.append(f"Summary: {project['description']}\n")
     for cat, value in _pep621_people(project.get("authors", [])).items():
-        metadata_text += f"{cat}: {value}\n"
+        parts.append(f"{cat}: {value}\n")
     for cat, value in _pep621_people(
         project.get("maintainers", []), "Maintainer"
     ).items():
-        metadata_text += f"{cat}: {value}\n"
+        parts.append(f"{cat}: {value}\n")
     if "keywords" in project:
-        metadata_text += f"Keywords: {','.join(project['keywords'])}\n"
+        parts.append(f"Keywords: {','.join(project['keywords'])}\n")
     for url_name, url in project.get("urls", {}).items():
-        metadata_text += f"Project-URL: {url_name}, {url}\n"
+        parts.append(f"Project-URL: {url_name}, {url}\n")
     for classifier in project.get("classifiers", []):
-        metadata_text += f"Classifier: {classifier}\n"
+        parts.append(f"Classifier: {classifier}\n")
     if "requires_python" in project:
-        metadata_text += f"Requires-Python: {project['requires_python']}\n"
+        parts.append(f"Requires-Python: {project['requires_python']}\n")
     for req in project.get("dependencies", []):
-        metadata_text += f"Requires-Dist: {req}\n"
+        parts.append(f"Requires-Dist: {req}\n")
     for extra, reqs in project.get("optional_dependencies", {}).items():
-        metadata_text += f"Provides-Extra: {extra}\n"
+        parts.append(f"Provides-Extra: {extra}\n")
         for req in reqs:
-            metadata_text += f"Requires-Dist: {req} ; extra == '{extra}'\n"
+            parts.append(f"Requires-Dist: {req} ; extra == '{extra}'\n")
     readme = project.get("readme", {})
     if "content_type" in readme:
-        metadata_text += f"Description-Content-Type: {readme['content_type']}\n"
+        parts.append(f"Description-Content-Type: {readme['content_type']}\n")
     if "text" in readme:
-        metadata_text += f"\n{readme['text']}\n"
+        parts.append(f"\n{readme['text']}\n")
     elif "path" in readme:
         text = (root / readme["path"]).read_text("utf-8")
-        metadata_text += f"\n{text}\n"
+        parts.append(f"\n{text}\n")
 
-    metadata_text += "\n"
+    parts.append("\n")
 
-    return metadata_text
+    return "".join(parts)
 
 
 def _pep621_people(
@@ -82,13 +84,13 @@ def create_entrypoints(project: Pep621Data) -> str:
     :project: The project data.
     """
     if project.get("entry_points"):
-        entrypoint_text = ""
+        parts = []
         for group_name in sorted(project["entry_points"]):
-            entrypoint_text += f"[{group_name}]\n"
+            parts.append(f"[{group_name}]\n")
             group = project["entry_points"][group_name]
             for name in sorted(group):
                 val = group[name]
-                entrypoint_text += f"{name}={val}\n"
-            entrypoint_text += "\n"
-        return entrypoint_text
+                parts.append(f"{name}={val}\n")
+            parts.append("\n")
+        return "".join(parts)
     return ""
@@ -0,0 +1,75 @@
+"""Tests for reading information from python modules."""
+import time
+
+import pytest
+from pymonorepo.analyse._analyse import (
+    AST_INFO_KEYS,
+    _parse_source,
+    _scan_source,
+    read_ast_info,
+)
+
+
+def test_read_parenthesized_comments_no_backtracking(tmp_path):
+    """Comments within a parenthesized value must not be split on every `#`,
+    which previously made a failed match take exponential time.
+    """
+    comments = "".join(f" # {i}" for i in range(1, 41))
+    path = tmp_path / "module.py"
+    path.write_text(f"__version__ = (\n    # see:{comments}\n    _get_version()\n)\n")
+    start = time.perf_counter()
+    assert read_ast_info(path, ["version"]) == {}
+    assert time.perf_counter() - start < 1
+
+
+def test_read_parenthesized_triple_quotes_no_backtracking(tmp_path):
+    """One-line triple quoted strings must not also match as three single quoted strings,
+    which previously made a failed match take exponential time.
+    """
+    lines = "".join(f'    """line {i}"""\n' for i in range(40))
+    path = tmp_path / "module.py"
+    path.write_text(f'__version__ = "1.0"\nHELP = (\n{lines}).strip()\n')
+    start = time.perf_counter()
+    assert read_ast_info(path, ["version", "description"]) == {"version": "1.0"}
+    assert time.perf_counter() - start < 1
+
+
+def test_read_parenthesized_version(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text('__version__ = (\n    # a # comment "with" quotes\n    "1.0"\n)\n')
+    assert read_ast_info(path, ["version"]) == {"version": "1.0"}
+
+
+@pytest.mark.parametrize(
+    "source,keys",
+    [
+        ('__version__ = "1.0"; x = 1\n', {"version"}),
+        ('"""Doc."""\r__version__ = "1.0"\r', {"version", "description"}),
+        ('"a" \\\n"b"\n__version__ = "1.0"\n', {"version", "description"}),
+        ('__version__ = "1.0"\nCONFIG = dict(\n__version__="9.9"\n)\n', {"version"}),
+        ('"""Doc."""\n__author__ = "me"\n__version__ = "1"\n__version__ = "2"\n', None),
+    ],
+    ids=["semicolon", "lone-cr", "continued-docstring", "column-0-kwarg", "reassigned"],
+)
+def test_read_matches_ast(tmp_path, source, keys):
+    """The scanned information must be the same as that from the full AST."""
+    path = tmp_path / "module.py"
+    path.write_bytes(source.encode())
+    expected = _parse_source(source.encode(), AST_INFO_KEYS if keys is None else keys)
+    if "name" in expected:
+        expected["authors"] = [{"name": expected.pop("name")}]
+    assert expected
+    assert read_ast_info(path, keys) == expected
+
+
+def test_scan_skips_bracketed_assignments():
+    source = '__version__ = "1.0"\nCONFIG = dict(\n__version__="9.9"\n)\n'
+    assert _scan_source(source.encode(), frozenset({"version"})) == {"version": "1.0"}
+
+
+def test_scan_lone_cr_line_endings():
+    source = '"""Doc."""\r__version__ = "1.0"\r'
+    assert _scan_source(source.encode(), frozenset({"version", "description"})) == {
+        "description": "Doc.",
+        "version": "1.0",
+    }
@@ -0,0 +1,18 @@
+"""Tests for parsing and validating the PEP 621 project table."""
+import os
+
+import pytest
+from pymonorepo.analyse._pep621 import parse
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+def test_readme_fifo_not_found(tmp_path):
+    """A readme that is not a regular file must be rejected, without blocking on it."""
+    os.mkfifo(tmp_path / "README.md")
+    result = parse(
+        {"project": {"name": "pkg", "version": "0.1.0", "readme": "README.md"}},
+        tmp_path,
+    )
+    assert [(e.key, e.msg) for e in result.errors] == [
+        ("project.readme", f"file not found: {tmp_path / 'README.md'}")
+    ]
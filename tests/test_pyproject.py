@@ -0,0 +1,42 @@
+"""Tests for reading the pyproject.toml file."""
+import pytest
+from pymonorepo.analyse._pyproject import parse_pyproject_toml
+
+
+def test_parse_revalidates_readme(tmp_path):
+    """Files referenced by the pyproject.toml must be re-validated on every parse."""
+    tmp_path.joinpath("pyproject.toml").write_text(
+        '[project]\nname = "pkg"\nversion = "0.1.0"\nreadme = "README.md"\n'
+    )
+    readme = tmp_path.joinpath("README.md")
+    readme.write_text("# pkg\n")
+    assert parse_pyproject_toml(tmp_path)["project"]["name"] == "pkg"
+    readme.unlink()
+    with pytest.raises(RuntimeError, match="file not found"):
+        parse_pyproject_toml(tmp_path)
+
+
+def test_parse_revalidates_workspace_packages(tmp_path):
+    """The workspace package globs must be re-resolved on every parse."""
+    tmp_path.joinpath("pyproject.toml").write_text(
+        '[project]\nname = "ws"\nversion = "0.1.0"\n'
+        '[tool.monorepo.workspace]\npackages = ["packages/*"]\n'
+    )
+    packages = tmp_path.joinpath("packages")
+    packages.joinpath("a").mkdir(parents=True)
+    assert parse_pyproject_toml(tmp_path)["tool"]["workspace"]["packages"] == [
+        packages / "a"
+    ]
+    packages.joinpath("b").mkdir()
+    assert sorted(parse_pyproject_toml(tmp_path)["tool"]["workspace"]["packages"]) == [
+        packages / "a",
+        packages / "b",
+    ]
+
+
+def test_parse_missing_file(tmp_path):
+    """A missing pyproject.toml must raise with its path, and no chained exception."""
+    with pytest.raises(FileNotFoundError) as exc_info:
+        parse_pyproject_toml(tmp_path)
+    assert exc_info.value.args == (tmp_path / "pyproject.toml",)
+    assert exc_info.value.__suppress_context__